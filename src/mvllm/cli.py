@@ -29,6 +29,12 @@ def run(
     reload: bool = typer.Option(
         False, "--reload", help="Enable auto-reload for development"
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        help="Number of worker processes (0 = one per CPU, up to 8)",
+    ),
     log_level: str = typer.Option(
         "INFO", "--log-level", help="Logging level (DEBUG, INFO, WARNING, ERROR)"
     ),
@@ -51,6 +57,8 @@ def run(
         host,
         "--port",
         str(port),
+        "--workers",
+        str(workers),
     ]
 
     if reload:
@@ -3,6 +3,7 @@ Configuration management for vLLM Router
 """
 
 import os
+import asyncio
 import toml
 import httpx
 from enum import Enum
@@ -93,6 +94,13 @@ class AppConfig(BaseModel):
     request_timeout: int = Field(default=30, ge=1)
     health_check_timeout: int = Field(default=5, ge=1)
     max_retries: int = Field(default=3, ge=0)
+    retry_base_delay: float = Field(
+        default=0.01, ge=0.0
+    )  # Delay before the first retry, doubled on each further retry (seconds)
+    retry_max_delay: float = Field(default=0.5, ge=0.0)  # Retry delay cap (seconds)
+    retry_jitter: float = Field(
+        default=0.5, ge=0.0
+    )  # Random extra fraction of the delay added to each retry
     failure_threshold: int = Field(default=2, ge=1)
     auto_recovery_threshold: int = Field(default=60, ge=1)
 
@@ -113,6 +121,11 @@ class AppConfig(BaseModel):
         default=3, ge=1
     )  # Consecutive failures before marking unhealthy
 
+    # Runtime configuration
+    use_uvloop: bool = Field(
+        default=True
+    )  # Run the event loop on uvloop when it is installed
+
 
 class Config:
     def __init__(self, config_path: str = None):
@@ -122,6 +135,8 @@ class Config:
         self.servers: List[ServerConfig] = []
         self.app_config: AppConfig = AppConfig()
         self.last_modified: Optional[datetime] = None
+        # Model name -> servers supporting it, rebuilt whenever model info changes
+        self._model_to_servers: Dict[str, List[ServerConfig]] = {}
         self.load_config()
 
     def load_config(self) -> None:
@@ -187,6 +202,7 @@ class Config:
 
             self.servers = new_servers
             self.app_config = new_app_config
+            self._rebuild_model_index()
 
             self.last_modified = datetime.fromtimestamp(
                 os.path.getmtime(self.config_path)
@@ -439,8 +455,12 @@ class Config:
         logger.debug("Starting health checks for all servers")
         results = {}
 
-        for server in self.servers:
-            is_healthy, response_time = await self.check_server_health(server)
+        # Probe all servers concurrently so a cycle takes as long as the slowest check
+        servers = list(self.servers)
+        checks = await asyncio.gather(
+            *(self.check_server_health(server) for server in servers)
+        )
+        for server, (is_healthy, response_time) in zip(servers, checks):
             results[server.url] = (is_healthy, response_time)
             logger.debug(
                 f"Health check for {server.url}: healthy={is_healthy}, response_time={response_time:.2f}s"
@@ -469,6 +489,7 @@ class Config:
 
                 server.supported_models = models
                 server.models_last_updated = datetime.now()
+                self._rebuild_model_index()
                 logger.info(
                     f"Updated models for {server.url}: {len(models)} models - {models}"
                 )
@@ -486,11 +507,17 @@ class Config:
 
         logger.info("Model information update completed")
 
+    def _rebuild_model_index(self) -> None:
+        """Rebuild the model name -> supporting servers index"""
+        model_to_servers: Dict[str, List[ServerConfig]] = {}
+        for server in self.servers:
+            for model_name in server.supported_models:
+                model_to_servers.setdefault(model_name, []).append(server)
+        self._model_to_servers = model_to_servers
+
     def get_servers_supporting_model(self, model_name: str) -> List[ServerConfig]:
         """Get list of servers that support the specified model"""
-        return [
-            server for server in self.servers if model_name in server.supported_models
-        ]
+        return list(self._model_to_servers.get(model_name, ()))
 
     def get_healthy_servers_supporting_model(
         self, model_name: str
@@ -498,6 +525,6 @@ class Config:
         """Get list of healthy servers that support the specified model"""
         return [
             server
-            for server in self.get_servers_supporting_model(model_name)
+            for server in self._model_to_servers.get(model_name, ())
             if server.is_healthy
         ]
@@ -3,9 +3,11 @@ Real-time load management for vLLM Router
 """
 
 import asyncio
-import aiohttp
+import httpx
 import sys
+import time
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
 from loguru import logger
 from rich.console import Console
@@ -19,6 +21,46 @@ __all__ = [
     "get_load_manager",
 ]
 
+# Metrics extracted from vLLM's /metrics endpoint: (line prefix, metrics key, type, bit)
+_TARGET_METRICS = (
+    (b"vllm:num_requests_running", "num_requests_running", int, 0b0001),
+    (b"vllm:num_requests_waiting", "num_requests_waiting", int, 0b0010),
+    (b"vllm:gpu_cache_usage_perc", "gpu_cache_usage_perc", float, 0b0100),
+    (b"process_max_fds", "process_max_fds", int, 0b1000),
+)
+_TARGET_PREFIXES = tuple(prefix for prefix, _, _, _ in _TARGET_METRICS)
+_ALL_TARGETS = 0b1111
+# Bytes that may follow a metric name: its labels or the value separator
+_NAME_TERMINATORS = (b"{", b" ")
+
+# Metrics reported for servers that have not been polled yet
+_EMPTY_LOAD = MappingProxyType(
+    {
+        "num_requests_running": 0,
+        "num_requests_waiting": 0,
+        "gpu_cache_usage_perc": 0.0,
+        "process_max_fds": 65535,
+        "system_load": 0,
+    }
+)
+
+# Upper bound for the poll interval when servers report a stable state
+_MAX_POLL_INTERVAL = 30
+
+# Servers whose load score is below this are preferred for routing
+_SCORE_THRESHOLD = 0.5
+
+# Smallest routing weight, so servers just under the threshold still get traffic
+_MIN_WEIGHT = 0.001
+
+
+def _load_score(running: int, waiting: int, capacity: int) -> float:
+    """Composite routing score: running requests weigh more than waiting ones,
+    divided by capacity so servers of different sizes compare fairly"""
+    if capacity > 0:
+        return (running + waiting * 0.5) / capacity
+    return float("inf")  # Servers with zero capacity should not be selected
+
 
 class LoadManager:
     def __init__(
@@ -26,7 +68,7 @@ class LoadManager:
     ):
         self.config = config
         self.server_loads: dict[str, dict] = {}  # Server load metrics dictionary
-        self.last_updated: dict[str, datetime] = {}  # Last update time
+        self.last_updated: dict[str, float] = {}  # Last update time (epoch seconds)
         self.load_check_lock = asyncio.Lock()
         self.fullscreen_mode = fullscreen_mode
         self.show_models = show_models  # Whether to display model information
@@ -41,21 +83,111 @@ class LoadManager:
 
         self.live_display = None
 
+        # The panel is built once; every rebuilt frame swaps in a new table
+        self._panel = Panel(
+            self._create_table(), padding=(0, 1)
+        )  # Reduce padding in fullscreen mode
+
+        # Per-server load and capacity stored as parallel lists indexed by
+        # position in config.servers, so summaries are a single sum() each
+        self._indexed_servers = None
+        self._url_to_idx: dict[str, int] = {}
+        self._system_loads: list[int] = []
+        self._capacities: list[int] = []
+        self._stats_cache: dict = {}
+        self._score_view: Optional[dict[str, tuple[int, int, int, float]]] = None
+        self._score_view_version = None
+
+        # Requests this router has forwarded and not yet finished, per server
+        # URL, and how many were reserved since the server's last metrics poll.
+        # Only the latter are missing from the polled running count, so the
+        # routing score adds min(pending, unpolled) to it
+        self._pending: dict[str, int] = {}
+        self._unpolled: dict[str, int] = {}
+
+        # Shared HTTP client for polling /metrics, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Bumped whenever a server's load changes, so the monitor can skip
+        # rebuilding the panel when nothing it displays has changed
+        self._state_version = 0
+        self._last_render_key = None
+        self._last_panel = None
+
+        # Adaptive poll interval, doubled while no server state changes
+        self._base_interval = 2
+        self._cur_interval = 2
+        self._idle_ticks = 0
+        # Set to cut a backed-off sleep short when traffic resumes
+        self._wake_monitor = asyncio.Event()
+
         # Initialize server status
         self._initialize_servers()
 
     def _initialize_servers(self):
         """Initialize all server status"""
         for server in self.config.servers:
-            self.server_loads[server.url] = {
-                "num_requests_running": 0,
-                "num_requests_waiting": 0,
-                "gpu_cache_usage_perc": 0.0,
-                "process_max_fds": 65535,
-                "system_load": 0,
-            }
+            self.server_loads[server.url] = dict(_EMPTY_LOAD)
             # Server status now uniformly uses the is_healthy field in config
-            self.last_updated[server.url] = datetime.now()
+            self.last_updated[server.url] = time.time()
+
+        self._sync_server_index()
+
+    def _sync_server_index(self):
+        """Rebuild the per-server lists when the configured server list changes"""
+        servers = self.config.servers
+        if servers is self._indexed_servers:
+            return
+
+        self._indexed_servers = servers
+        self._score_view = None
+        self._url_to_idx = {server.url: idx for idx, server in enumerate(servers)}
+        self._system_loads = [
+            self.server_loads.get(server.url, _EMPTY_LOAD)["system_load"]
+            for server in servers
+        ]
+        self._capacities = [server.max_concurrent_requests for server in servers]
+
+        # Preallocate the nested statistics structure filled in by get_load_stats
+        self._stats_cache = {
+            "total_servers": len(servers),
+            "healthy_servers": 0,
+            "server_loads": {
+                server.url: {
+                    "current_load": 0,
+                    "max_capacity": server.max_concurrent_requests,
+                    "available_capacity": server.max_concurrent_requests,
+                    "utilization": 0,
+                    "status": server.is_healthy,
+                    "health_status": None,
+                    "last_updated": None,
+                    "detailed_metrics": {
+                        "num_requests_running": 0,
+                        "num_requests_waiting": 0,
+                        "gpu_cache_usage_perc": 0.0,
+                        "process_max_fds": 65535,
+                    },
+                }
+                for server in servers
+            },
+            "summary": {
+                "total_active_load": 0,
+                "total_capacity": 0,
+                "overall_utilization": 0,
+            },
+        }
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client used for polling, creating it if needed"""
+        if self._client is None or self._client.is_closed:
+            # HTTP/2 lets servers behind the same TLS endpoint share one connection;
+            # plain http:// backends keep using pooled HTTP/1.1 keep-alive connections
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+        return self._client
 
     async def get_server_load(self, server_url: str) -> Optional[dict]:
         """Get real-time load of the specified server (using /metrics endpoint)"""
@@ -63,225 +195,357 @@ class LoadManager:
             # Use the /metrics endpoint provided by the server to get actual load
             metrics_url = f"{server_url}/metrics"
 
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=5)
-            ) as session:
-                async with session.get(metrics_url) as response:
-                    if response.status == 200:
-                        metrics_text = await response.text()
-                        load_metrics = self._parse_vllm_metrics(metrics_text)
-                        logger.debug(
-                            f"Got load metrics from {server_url}: {load_metrics['system_load']}"
-                        )
-                        return load_metrics
-                    else:
-                        logger.warning(
-                            f"Failed to get metrics from {server_url}, status: {response.status}"
-                        )
-                        return None
+            client = self._ensure_client()
+            async with client.stream("GET", metrics_url) as response:
+                if response.status_code == 200:
+                    load_metrics = await self._parse_vllm_metrics_stream(response)
+                    logger.opt(lazy=True).debug(
+                        "Got load metrics from {}: {}",
+                        lambda: server_url,
+                        lambda: load_metrics["system_load"],
+                    )
+                    return load_metrics
+                else:
+                    logger.warning(
+                        f"Failed to get metrics from {server_url}, status: {response.status_code}"
+                    )
+                    return None
         except Exception as e:
             logger.error(f"Error getting load from {server_url}: {e}")
             return None
 
-    def _parse_vllm_metrics(self, metrics_text: str) -> dict:
-        """Parse vLLM metrics data and extract multiple metrics"""
-        try:
-            metrics = {
-                "num_requests_running": 0,
-                "num_requests_waiting": 0,
-                "gpu_cache_usage_perc": 0.0,
-                "process_max_fds": 65535,  # Default value
-                "system_load": 0,  # Calculated composite load
-            }
-
-            for line in metrics_text.split("\n"):
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                # Parse different metrics
-                if line.startswith("vllm:num_requests_running"):
-                    value = self._extract_metric_value(line)
-                    if value is not None:
-                        metrics["num_requests_running"] = int(value)
-
-                elif line.startswith("vllm:num_requests_waiting"):
-                    value = self._extract_metric_value(line)
-                    if value is not None:
-                        metrics["num_requests_waiting"] = int(value)
-
-                elif line.startswith("vllm:gpu_cache_usage_perc"):
-                    value = self._extract_metric_value(line)
-                    if value is not None:
-                        metrics["gpu_cache_usage_perc"] = float(value)
-
-                elif line.startswith("process_max_fds"):
-                    value = self._extract_metric_value(line)
-                    if value is not None:
-                        metrics["process_max_fds"] = int(value)
-
-            # Calculate composite load: running + waiting, but not exceeding max file descriptor limit
-            total_requests = (
-                metrics["num_requests_running"] + metrics["num_requests_waiting"]
-            )
-            # Adjust load weight based on system file descriptor limit
-            max_concurrent_by_fds = max(
-                1, metrics["process_max_fds"] // 1000
-            )  # Estimate max concurrent requests
-            metrics["system_load"] = min(total_requests, max_concurrent_by_fds)
-
-            logger.debug(
-                f"Parsed metrics: running={metrics['num_requests_running']}, "
-                f"waiting={metrics['num_requests_waiting']}, "
-                f"gpu_cache={metrics['gpu_cache_usage_perc']:.1f}%, "
-                f"max_fds={metrics['process_max_fds']}, "
-                f"system_load={metrics['system_load']}"
-            )
+    async def _parse_vllm_metrics_stream(self, response: httpx.Response) -> dict:
+        """Parse vLLM metrics from a streaming response, stopping once all target metrics are found"""
+        metrics = self._default_metrics()
+        found = 0
+        buffer = b""
+
+        chunks = response.aiter_bytes(4096)
+        async for chunk in chunks:
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                found |= self._parse_metric_line(line, metrics)
+                if found == _ALL_TARGETS:
+                    break
+
+            # vLLM emits the target metrics well before the histogram buckets,
+            # so the rest of the body does not need to be parsed
+            if found == _ALL_TARGETS:
+                break
+        else:
+            if buffer:
+                self._parse_metric_line(buffer, metrics)
+
+        # Drain the rest from the same iterator without parsing it: closing a
+        # response with unread body makes httpcore drop the connection instead
+        # of returning it to the pool
+        async for _ in chunks:
+            pass
+
+        return self._finalize_metrics(metrics)
+
+    def _default_metrics(self) -> dict:
+        """Create a metrics dictionary filled with default values"""
+        return dict(_EMPTY_LOAD)
+
+    def _parse_metric_line(self, line: bytes, metrics: dict) -> int:
+        """Parse a single raw metrics line into metrics, returning the bit of the target metric it set (0 if none)"""
+        # A single startswith over all prefixes rejects comments, histogram
+        # buckets and other metrics without decoding the line
+        if not line.startswith(_TARGET_PREFIXES):
+            return 0
+
+        for prefix, key, cast, bit in _TARGET_METRICS:
+            if line.startswith(prefix):
+                # The metric name must end at the prefix, so longer names such
+                # as vllm:num_requests_waiting_by_reason are not mistaken for it
+                if line[len(prefix) : len(prefix) + 1] not in _NAME_TERMINATORS:
+                    return 0
+                value = self._extract_metric_value(line)
+                if value is None:
+                    return 0
+                metrics[key] = cast(value)
+                return bit
+
+        return 0
+
+    def _finalize_metrics(self, metrics: dict) -> dict:
+        """Calculate the composite system load from the parsed metrics"""
+        # Calculate composite load: running + waiting, but not exceeding max file descriptor limit
+        total_requests = (
+            metrics["num_requests_running"] + metrics["num_requests_waiting"]
+        )
+        # Adjust load weight based on system file descriptor limit
+        max_concurrent_by_fds = max(
+            1, metrics["process_max_fds"] // 1000
+        )  # Estimate max concurrent requests
+        metrics["system_load"] = min(total_requests, max_concurrent_by_fds)
+
+        # Lazy formatting: the message is only built when DEBUG is enabled
+        logger.opt(lazy=True).debug(
+            "Parsed metrics: running={}, waiting={}, gpu_cache={:.1f}%, max_fds={}, system_load={}",
+            lambda: metrics["num_requests_running"],
+            lambda: metrics["num_requests_waiting"],
+            lambda: metrics["gpu_cache_usage_perc"],
+            lambda: metrics["process_max_fds"],
+            lambda: metrics["system_load"],
+        )
 
-            return metrics
+        return metrics
 
-        except Exception as e:
-            logger.error(f"Error parsing vLLM metrics: {e}")
-            return {
-                "num_requests_running": 0,
-                "num_requests_waiting": 0,
-                "gpu_cache_usage_perc": 0.0,
-                "process_max_fds": 65535,
-                "system_load": 0,
-            }
-
-    def _extract_metric_value(self, line: str) -> float:
+    def _extract_metric_value(self, line: bytes) -> Optional[float]:
         """Extract numeric value from metrics line"""
         try:
             # Parse lines like: vllm:num_requests_running{engine="0",model_name="llama3.1:8b"} 15.0
-            parts = line.split(" ")
-            if len(parts) >= 2:
-                return float(parts[-1])
-        except (ValueError, IndexError):
-            pass
-        return None
+            # The value is always the last space-separated token
+            return float(line.rpartition(b" ")[2])
+        except ValueError:
+            return None
 
     async def update_all_server_loads(self):
         """Update load information for all servers"""
         async with self.load_check_lock:
+            self._sync_server_index()
             tasks = []
             for server in self.config.servers:
                 if server.is_healthy:  # Only check healthy servers
                     tasks.append(self._update_single_server_load(server.url))
 
+            # _update_single_server_load handles its own errors, so no
+            # exception objects need to be collected here
             if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+                await asyncio.gather(*tasks)
 
     async def _update_single_server_load(self, server_url: str):
         """Update load for a single server"""
         try:
+            # Reservations made before the poll are in the polled running count
+            polled = self._unpolled.get(server_url, 0)
             load = await self.get_server_load(server_url)
             if load is not None:
+                unpolled = self._unpolled.get(server_url, 0) - polled
+                if unpolled > 0:
+                    self._unpolled[server_url] = unpolled
+                else:
+                    self._unpolled.pop(server_url, None)
+
+                if load != self.server_loads.get(server_url):
+                    self._state_version += 1
+                else:
+                    self._rescore(server_url)
                 self.server_loads[server_url] = load
-                self.last_updated[server_url] = datetime.now()
+                self.last_updated[server_url] = time.time()
+                idx = self._url_to_idx.get(server_url)
+                if idx is not None:
+                    self._system_loads[idx] = load["system_load"]
             else:
                 logger.warning(f"Failed to get metrics from {server_url}")
         except Exception as e:
             logger.error(f"Error updating load for {server_url}: {e}")
 
-    def get_load_stats(self) -> dict:
-        """Get load statistics"""
-        healthy_servers = self.config.get_healthy_servers()
+    def get_load_stats(self, include_timestamps: bool = True) -> dict:
+        """Get load statistics
 
-        return {
-            "total_servers": len(self.config.servers),
-            "healthy_servers": len(healthy_servers),
-            "server_loads": {
-                server.url: {
-                    "current_load": self.server_loads.get(server.url, {}).get(
-                        "system_load", 0
-                    ),
-                    "max_capacity": server.max_concurrent_requests,
-                    "available_capacity": max(
-                        0,
-                        server.max_concurrent_requests
-                        - self.server_loads.get(server.url, {}).get("system_load", 0),
+        The returned dictionary is reused and updated in place on every call,
+        so callers must treat it as read-only and copy it if they need to keep
+        a snapshot. Formatting last_updated is skipped when include_timestamps
+        is False, which the render loop uses since it does not display it.
+        """
+        self._sync_server_index()
+        stats = self._stats_cache
+        server_loads = stats["server_loads"]
+
+        healthy_count = 0
+        for server in self.config.servers:
+            load = self.server_loads.get(server.url, _EMPTY_LOAD)
+            system_load = load["system_load"]
+            max_capacity = server.max_concurrent_requests
+            if server.is_healthy:
+                healthy_count += 1
+
+            entry = server_loads[server.url]
+            entry["current_load"] = system_load
+            entry["max_capacity"] = max_capacity
+            entry["available_capacity"] = max(0, max_capacity - system_load)
+            entry["utilization"] = (
+                min(100, system_load / max_capacity * 100) if max_capacity > 0 else 0
+            )
+            entry["status"] = server.is_healthy
+            entry["health_status"] = (
+                server.health_status.value
+                if isinstance(server.health_status, ServerHealthStatus)
+                else server.health_status
+            )
+            entry["last_updated"] = (
+                datetime.fromtimestamp(self.last_updated[server.url]).isoformat()
+                if include_timestamps and server.url in self.last_updated
+                else None
+            )
+
+            detailed_metrics = entry["detailed_metrics"]
+            detailed_metrics["num_requests_running"] = load["num_requests_running"]
+            detailed_metrics["num_requests_waiting"] = load["num_requests_waiting"]
+            detailed_metrics["gpu_cache_usage_perc"] = load["gpu_cache_usage_perc"]
+            detailed_metrics["process_max_fds"] = load["process_max_fds"]
+
+        total_active_load = sum(self._system_loads)
+        total_capacity = sum(self._capacities)
+
+        stats["healthy_servers"] = healthy_count
+        summary = stats["summary"]
+        summary["total_active_load"] = total_active_load
+        summary["total_capacity"] = total_capacity
+        summary["overall_utilization"] = (
+            total_active_load / total_capacity * 100 if total_capacity > 0 else 0
+        )
+
+        return stats
+
+    def get_server_score_view(self) -> dict[str, tuple[int, int, int, float]]:
+        """Get (running, waiting, capacity, score) per server URL for request routing
+
+        The view is only rebuilt when server metrics or the server list change,
+        so routing does not recompute it on every request; reserve() and
+        release() update the affected server's entry in place.
+        """
+        self._sync_server_index()
+        version = self._state_version
+        if self._score_view is None or self._score_view_version != version:
+            view = {}
+            for server in self.config.servers:
+                load = self.server_loads.get(server.url, _EMPTY_LOAD)
+                running = load["num_requests_running"]
+                waiting = load["num_requests_waiting"]
+                capacity = server.max_concurrent_requests
+                view[server.url] = (
+                    running,
+                    waiting,
+                    capacity,
+                    _load_score(
+                        running + self._unseen_requests(server.url), waiting, capacity
                     ),
-                    "utilization": min(
-                        100,
-                        (
-                            self.server_loads.get(server.url, {}).get("system_load", 0)
-                            / server.max_concurrent_requests
-                            * 100
-                        ),
-                    )
-                    if server.max_concurrent_requests > 0
-                    else 0,
-                    "status": server.is_healthy,
-                    "health_status": server.health_status.value
-                    if isinstance(server.health_status, ServerHealthStatus)
-                    else server.health_status,
-                    "last_updated": self.last_updated.get(server.url, None).isoformat()
-                    if self.last_updated.get(server.url, None)
-                    else None,
-                    "detailed_metrics": {
-                        "num_requests_running": self.server_loads.get(
-                            server.url, {}
-                        ).get("num_requests_running", 0),
-                        "num_requests_waiting": self.server_loads.get(
-                            server.url, {}
-                        ).get("num_requests_waiting", 0),
-                        "gpu_cache_usage_perc": self.server_loads.get(
-                            server.url, {}
-                        ).get("gpu_cache_usage_perc", 0.0),
-                        "process_max_fds": self.server_loads.get(server.url, {}).get(
-                            "process_max_fds", 65535
-                        ),
-                    },
-                }
-                for server in self.config.servers
-            },
-            "summary": {
-                "total_active_load": sum(
-                    metrics.get("system_load", 0)
-                    for metrics in self.server_loads.values()
-                ),
-                "total_capacity": sum(
-                    server.max_concurrent_requests for server in self.config.servers
-                ),
-                "overall_utilization": sum(
-                    metrics.get("system_load", 0)
-                    for metrics in self.server_loads.values()
                 )
-                / sum(server.max_concurrent_requests for server in self.config.servers)
-                * 100
-                if sum(server.max_concurrent_requests for server in self.config.servers)
-                > 0
-                else 0,
-            },
-        }
+            self._score_view = view
+            self._score_view_version = version
+        return self._score_view
+
+    def _unseen_requests(self, server_url: str) -> int:
+        """Requests in flight on a server that its last polled metrics do not include"""
+        return min(self._pending.get(server_url, 0), self._unpolled.get(server_url, 0))
+
+    def _rescore(self, server_url: str) -> None:
+        """Recompute one server's score in the view after its request counts changed"""
+        view = self._score_view
+        if view is None:
+            return  # Built with the current request counts on next use
+        entry = view.get(server_url)
+        if entry is not None:
+            running, waiting, capacity, _ = entry
+            view[server_url] = (
+                running,
+                waiting,
+                capacity,
+                _load_score(
+                    running + self._unseen_requests(server_url), waiting, capacity
+                ),
+            )
+
+    def reserve(self, server_url: str) -> None:
+        """Count a request forwarded to a server until release() is called"""
+        self._pending[server_url] = self._pending.get(server_url, 0) + 1
+        self._unpolled[server_url] = self._unpolled.get(server_url, 0) + 1
+        self._rescore(server_url)
+
+        # New traffic is about to change the server metrics, so stop backing
+        # off and wake the monitor if it is in a long idle sleep
+        if self._cur_interval > self._base_interval:
+            self._idle_ticks = 0
+            self._cur_interval = self._base_interval
+            self._wake_monitor.set()
+
+    def release(self, server_url: str) -> None:
+        """Stop counting a request reserved with reserve()"""
+        count = self._pending.get(server_url, 0) - 1
+        if count > 0:
+            self._pending[server_url] = count
+        else:
+            self._pending.pop(server_url, None)
+        self._rescore(server_url)
+
+    def get_optimal_candidates(
+        self, servers: list, threshold: float = _SCORE_THRESHOLD
+    ) -> tuple[list[str], list[float]]:
+        """Get the URLs of the given servers that a request should be routed to,
+        with cumulative weights for a weighted random pick
+
+        Servers scoring below the threshold are preferred and weighted by their
+        headroom under it, so idler servers get more traffic; if there are none,
+        the servers sharing the lowest score are returned with equal weights.
+        """
+        view = self.get_server_score_view()
+        under_threshold = []
+        cum_weights = []
+        total_weight = 0.0
+        best_servers = []
+        best_score = float("inf")
+
+        for server in servers:
+            entry = view.get(server.url)
+            score = (
+                entry[3]
+                if entry is not None
+                else _load_score(0, 0, server.max_concurrent_requests)
+            )
+
+            if score < threshold:
+                under_threshold.append(server.url)
+                total_weight += max(_MIN_WEIGHT, threshold - score)
+                cum_weights.append(total_weight)
+
+            if score < best_score:
+                best_score = score
+                best_servers = [server.url]
+            elif score == best_score:
+                best_servers.append(server.url)
+
+        if under_threshold:
+            return under_threshold, cum_weights
+        return best_servers, list(range(1, len(best_servers) + 1))
+
+    def _create_table(self) -> Table:
+        """Create the load table with its columns"""
+        # Main table - display detailed load data (use index instead of time, time shown in title)
+        table = Table(show_header=True, header_style="bold blue", box=None)
+        table.add_column("#", style="cyan", justify="right", width=2)
+        table.add_column(
+            "Server", style="green", width=25
+        )  # Reserve enough space for full URL
+
+        # Only display model column when model parameter is specified
+        if self.show_models:
+            table.add_column("Models", style="blue", width=20)  # New model name column
+
+        table.add_column("Running", style="yellow", justify="right", width=8)
+        table.add_column("Waiting", style="bright_yellow", justify="right", width=8)
+        table.add_column("Capacity", style="magenta", justify="right", width=8)
+        table.add_column("Usage", style="cyan", justify="right", width=7)
+        return table
 
     def create_load_status_panel(self):
         """Create load status panel"""
         try:
-            stats = self.get_load_stats()
-
-            # Create main table - display detailed load data (use index instead of time, time shown in title)
-            table = Table(show_header=True, header_style="bold blue", box=None)
-            table.add_column("#", style="cyan", justify="right", width=2)
-            table.add_column(
-                "Server", style="green", width=25
-            )  # Reserve enough space for full URL
-
-            # Only display model column when model parameter is specified
-            if self.show_models:
-                table.add_column(
-                    "Models", style="blue", width=20
-                )  # New model name column
-
-            table.add_column("Running", style="yellow", justify="right", width=8)
-            table.add_column("Waiting", style="bright_yellow", justify="right", width=8)
-            table.add_column("Capacity", style="magenta", justify="right", width=8)
-            table.add_column("Usage", style="cyan", justify="right", width=7)
+            stats = self.get_load_stats(include_timestamps=False)
+
+            # Fill a new table rather than clearing the previous one: Live
+            # renders the panel from its refresh thread, so a table that may be
+            # on screen is never modified. Frames are only rebuilt when the
+            # displayed data changed (see _refresh_live)
+            table = self._create_table()
 
             # Server load information
             server_rows = []
-            current_time = datetime.now().strftime("%H:%M:%S")
+            current_time = time.strftime("%H:%M:%S")
             row_index = 1
 
             for server in self.config.servers:
@@ -404,25 +668,22 @@ class LoadManager:
             # Choose different panel style based on mode
             displayed_servers = len(server_rows)
 
+            panel_title = self._panel_title(current_time)
             if self.fullscreen_mode:
                 # Fullscreen mode: more concise title and style
-                panel_title = f"vLLM Router Monitor ({current_time})"
                 panel_subtitle = f"{displayed_servers}/{total_servers} Servers | {total_running} Running | {total_waiting} Waiting | {overall_utilization:.1f}% Usage"
                 border_style = "bright_blue"
             else:
                 # Normal mode: original detailed style
-                panel_title = f"vLLM Router - Real-time Load Monitor ({current_time})"
                 panel_subtitle = f"Health: {healthy_count}/{total_servers} | {health_status} | Running: {total_running} | Waiting: {total_waiting} | Total Usage: {overall_utilization:.1f}%"
                 border_style = "blue"
 
-            # Create main panel
-            panel = Panel(
-                table,
-                title=panel_title,
-                subtitle=panel_subtitle,
-                border_style=border_style,
-                padding=(0, 1),  # Reduce padding in fullscreen mode
-            )
+            # Update main panel
+            panel = self._panel
+            panel.renderable = table
+            panel.title = panel_title
+            panel.subtitle = panel_subtitle
+            panel.border_style = border_style
 
             return panel
 
@@ -434,21 +695,89 @@ class LoadManager:
                 border_style="red",
             )
 
+    def _panel_title(self, current_time: str) -> str:
+        """Build the panel title for the given clock string"""
+        if self.fullscreen_mode:
+            return f"vLLM Router Monitor ({current_time})"
+        return f"vLLM Router - Real-time Load Monitor ({current_time})"
+
+    def _render_key(self) -> tuple:
+        """Key covering everything the load panel displays except the clock"""
+        return (
+            self._state_version,
+            tuple(
+                (
+                    server.url,
+                    server.is_healthy,
+                    server.health_status,
+                    server.max_concurrent_requests,
+                    tuple(server.supported_models) if self.show_models else None,
+                )
+                for server in self.config.servers
+            ),
+        )
+
+    def _refresh_live(self, live: Live):
+        """Update the live display, rebuilding the panel only when its data changed"""
+        render_key = self._render_key()
+        if self._last_panel is not None and render_key == self._last_render_key:
+            # Nothing changed since the last frame, only the clock needs updating
+            self._last_panel.title = self._panel_title(time.strftime("%H:%M:%S"))
+        else:
+            self._last_panel = self.create_load_status_panel()
+            self._last_render_key = render_key
+        live.update(self._last_panel)
+
+    async def _update_and_backoff(self):
+        """Update all server loads and adapt the poll interval to whether anything changed"""
+        version = self._state_version
+        await self.update_all_server_loads()
+
+        if self._state_version != version:
+            self._idle_ticks = 0
+            self._cur_interval = self._base_interval
+        else:
+            self._idle_ticks += 1
+            self._cur_interval = min(
+                self._base_interval * 2 ** min(self._idle_ticks, 4),
+                _MAX_POLL_INTERVAL,
+            )
+
+    async def _sleep_until_next_poll(self):
+        """Sleep for the current poll interval, or until reserve() wakes the monitor"""
+        try:
+            await asyncio.wait_for(self._wake_monitor.wait(), self._cur_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_monitor.clear()
+
     async def start_load_monitor(self, interval: int = 2, use_rich: bool = True):
-        """Start real-time load monitoring"""
+        """Start real-time load monitoring
+
+        interval is the base poll interval; it backs off up to
+        _MAX_POLL_INTERVAL while server loads stay unchanged.
+        """
+        self._base_interval = interval
+        self._cur_interval = interval
+        self._idle_ticks = 0
+
         if not use_rich:
             logger.info("Load monitoring started - using simple mode")
 
             async def simple_monitor_loop():
+                tick = 0
                 try:
                     while True:
-                        await self.update_all_server_loads()
-                        stats = self.get_load_stats()
-                        logger.opt(extra={"status_update": True}).info(
-                            f"Load Status: Total Load: {stats['summary']['total_active_load']}, "
-                            f"Utilization: {stats['summary']['overall_utilization']:.1f}%"
-                        )
-                        await asyncio.sleep(interval)
+                        await self._update_and_backoff()
+                        tick += 1
+                        # Only log the status line every 10 updates
+                        if tick % 10 == 0:
+                            stats = self.get_load_stats(include_timestamps=False)
+                            logger.opt(extra={"status_update": True}).info(
+                                f"Load Status: Total Load: {stats['summary']['total_active_load']}, "
+                                f"Utilization: {stats['summary']['overall_utilization']:.1f}%"
+                            )
+                        await self._sleep_until_next_poll()
                 except asyncio.CancelledError:
                     logger.info("Simple load monitoring stopped")
                 except Exception as e:
@@ -465,7 +794,9 @@ class LoadManager:
         async def rich_monitor_loop():
             try:
                 # Initialize panel
-                initial_panel = self.create_load_status_panel()
+                self._last_render_key = self._render_key()
+                self._last_panel = self.create_load_status_panel()
+                initial_panel = self._last_panel
 
                 # Fullscreen mode uses different display parameters
                 if self.fullscreen_mode:
@@ -479,10 +810,9 @@ class LoadManager:
                     ) as live:
                         while True:
                             try:
-                                await self.update_all_server_loads()
-                                new_panel = self.create_load_status_panel()
-                                live.update(new_panel)
-                                await asyncio.sleep(interval)
+                                await self._update_and_backoff()
+                                self._refresh_live(live)
+                                await self._sleep_until_next_poll()
                             except Exception as e:
                                 logger.error(f"Error updating load panel: {e}")
                                 await asyncio.sleep(interval)
@@ -493,10 +823,9 @@ class LoadManager:
                     ) as live:
                         while True:
                             try:
-                                await self.update_all_server_loads()
-                                new_panel = self.create_load_status_panel()
-                                live.update(new_panel)
-                                await asyncio.sleep(interval)
+                                await self._update_and_backoff()
+                                self._refresh_live(live)
+                                await self._sleep_until_next_poll()
                             except Exception as e:
                                 logger.error(f"Error updating load panel: {e}")
                                 await asyncio.sleep(interval)
@@ -526,6 +855,10 @@ class LoadManager:
                 pass
             logger.info("Load monitoring stopped")
 
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
 
 # Global load manager instance
 _global_load_manager = None
@@ -3,11 +3,14 @@ FastAPI application for vLLM Router
 """
 
 import os
+import time
+import argparse
 import asyncio
+import httpx
+import orjson
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 import uvicorn
 from loguru import logger
 
@@ -15,15 +18,22 @@ from mvllm.routes import router
 
 from .config import get_config
 from .load_manager import get_load_manager
+from .responses import ORJSONResponse
 from . import __version__
 
 # Remove default logging handler
 logger.remove()
 
+# Whether setup_logging() has run in this process; uvicorn worker processes
+# import this module afresh and have to configure logging themselves
+_logging_configured = False
+
 
 # Configure logging with Rich console
 def setup_logging():
     """Setup Rich-based logging with console and file output"""
+    global _logging_configured
+    _logging_configured = True
 
     # Create logs directory if it doesn't exist
     logs_dir = "logs"
@@ -57,15 +67,23 @@ def setup_logging():
         )
         logger.info("Console logging enabled")
 
+    # loguru rotation is not safe across processes: with several workers all
+    # processes only append to the shared files, which are then left to an
+    # external tool such as logrotate (copytruncate)
+    multi_process = int(os.getenv("WORKERS", "1")) > 1
+
+    def rotation_options(rotation: str, retention: str) -> dict:
+        if multi_process:
+            return {}
+        return {"rotation": rotation, "retention": retention, "compression": "zip"}
+
     # Always enable file logging
     logger.add(
         os.path.join(logs_dir, "mvllm.log"),
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         level=os.getenv("LOG_LEVEL", "INFO"),
-        rotation="10 MB",
-        retention="7 days",
-        compression="zip",
         encoding="utf-8",
+        **rotation_options("10 MB", "7 days"),
     )
 
     # Error log file
@@ -73,10 +91,8 @@ def setup_logging():
         os.path.join(logs_dir, "mvllm-error.log"),
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         level="ERROR",
-        rotation="10 MB",
-        retention="30 days",
-        compression="zip",
         encoding="utf-8",
+        **rotation_options("10 MB", "30 days"),
     )
 
     # Clean structured log file for analytics
@@ -84,10 +100,8 @@ def setup_logging():
         os.path.join(logs_dir, "mvllm-structured.log"),
         format="{time:YYYY-MM-DD HH:mm:ss} | {level.name} | {message} | {extra}",
         level=os.getenv("LOG_LEVEL", "INFO"),
-        rotation="50 MB",
-        retention="7 days",
-        compression="zip",
         encoding="utf-8",
+        **rotation_options("50 MB", "7 days"),
     )
 
     # Log startup status
@@ -103,6 +117,13 @@ def setup_logging():
 # Global variables for services
 load_manager = None
 
+# Upper bound for --workers 0, which otherwise starts one worker per CPU core
+MAX_AUTO_WORKERS = 8
+
+# How long a serialized /health or /load-stats payload is served before it is
+# rebuilt; probes hitting these endpoints then cost a single cached write
+SNAPSHOT_TTL = 1.0
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -110,11 +131,21 @@ async def lifespan(app: FastAPI):
     global load_manager
 
     # Startup
+    if not _logging_configured:
+        setup_logging()
     logger.info("Starting vLLM Router...")
 
     # Initialize configuration
     config = get_config()
 
+    # Shared HTTP client for forwarding requests, so connections to the
+    # vLLM servers are pooled and kept alive across requests
+    app.state.http_client = httpx.AsyncClient(
+        timeout=config.app_config.request_timeout,
+        limits=httpx.Limits(max_connections=1024, max_keepalive_connections=512),
+        http2=True,
+    )
+
     # Initialize load manager
     # Detect if console output is enabled to decide whether to use fullscreen mode
     console_enabled = os.getenv("LOG_TO_CONSOLE", "false").lower() == "true"
@@ -125,11 +156,15 @@ async def lifespan(app: FastAPI):
     # Get parameter for whether to display model information
     show_models = os.getenv("SHOW_MODELS", "false").lower() == "true"
 
+    # Several worker processes cannot share one terminal, so only a single
+    # worker renders the Rich display
+    use_rich = int(os.getenv("WORKERS", "1")) <= 1
+
     load_manager_instance = get_load_manager(
         fullscreen_mode=fullscreen_mode, show_models=show_models
     )
     await load_manager_instance.start_load_monitor(
-        interval=0.5, use_rich=True
+        interval=0.5, use_rich=use_rich
     )  # Update load status every 0.5 seconds, use Rich display
 
     if fullscreen_mode:
@@ -169,19 +204,17 @@ async def lifespan(app: FastAPI):
     if load_manager_instance:
         await load_manager_instance.stop_load_monitor()
 
-    if health_check_task and not health_check_task.done():
-        health_check_task.cancel()
-        try:
-            await health_check_task
-        except asyncio.CancelledError:
-            pass
+    # Cancel the background loops together and wait for all of them at once
+    background_tasks = [
+        task
+        for task in (health_check_task, config_reload_task)
+        if task and not task.done()
+    ]
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
 
-    if config_reload_task and not config_reload_task.done():
-        config_reload_task.cancel()
-        try:
-            await config_reload_task
-        except asyncio.CancelledError:
-            pass
+    await app.state.http_client.aclose()
 
     logger.info("vLLM Router shutdown complete")
 
@@ -192,7 +225,7 @@ async def active_health_check_loop(config):
         f"Starting active health check loop with interval: {config.app_config.health_check_interval}s"
     )
 
-    model_update_counter = getattr(active_health_check_loop, "counter", 0)
+    model_update_counter = 0
 
     async def run_cycle():
         nonlocal model_update_counter
@@ -203,12 +236,14 @@ async def active_health_check_loop(config):
         # Update model information periodically (every 10 health check cycles)
         # This prevents overwhelming the servers with model requests
         model_update_counter += 1
-        setattr(active_health_check_loop, "counter", model_update_counter)
 
         if model_update_counter % 10 == 0:  # Update models every 10 cycles
-            logger.info("Updating model information during health check cycle...")
+            logger.debug("Updating model information during health check cycle...")
             await config.update_all_server_models()
 
+        # Rebuild the /health payload right after the check results change
+        _refresh_snapshot("health_snapshot", _build_health_payload)
+
         # Log summary of health check results
         healthy_count = sum(1 for is_healthy, _ in health_results.values() if is_healthy)
         total_count = len(health_results)
@@ -284,6 +319,7 @@ app = FastAPI(
     description="A FastAPI-based load balancer for vLLM servers with OpenAI-compatible API",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -305,9 +341,25 @@ async def root():
     return {"service": "vLLM Router", "version": __version__, "status": "running"}
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
+def _refresh_snapshot(name: str, build) -> bytes:
+    """Serialize a monitoring payload and store it on the app state"""
+    content = orjson.dumps(build())
+    setattr(app.state, name, (time.monotonic() + SNAPSHOT_TTL, content))
+    return content
+
+
+def _snapshot_response(name: str, build) -> Response:
+    """Serve a cached monitoring payload, rebuilding it once it has expired"""
+    snapshot = getattr(app.state, name, None)
+    if snapshot is not None and snapshot[0] > time.monotonic():
+        content = snapshot[1]
+    else:
+        content = _refresh_snapshot(name, build)
+    return Response(content=content, media_type="application/json")
+
+
+def _build_health_payload() -> dict:
+    """Build the /health payload"""
     config = get_config()
     healthy_servers = config.get_healthy_servers()
     total_servers = len(config.servers)
@@ -366,9 +418,14 @@ async def health_check():
     }
 
 
-@app.get("/load-stats")
-async def load_stats():
-    """Load statistics endpoint"""
+@app.get("/health")
+async def health_check():
+    """Health check endpoint"""
+    return _snapshot_response("health_snapshot", _build_health_payload)
+
+
+def _build_load_stats_payload() -> dict:
+    """Build the /load-stats payload"""
     load_manager = get_load_manager()
     stats = load_manager.get_load_stats()
 
@@ -398,6 +455,12 @@ async def load_stats():
     }
 
 
+@app.get("/load-stats")
+async def load_stats():
+    """Load statistics endpoint"""
+    return _snapshot_response("load_stats_snapshot", _build_load_stats_payload)
+
+
 @app.get("/server-models")
 async def server_models():
     """Get all servers and their supported models"""
@@ -426,7 +489,7 @@ async def server_models():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """HTTP exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -448,7 +511,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         error_message=str(exc),
         status="unhandled_exception",
     ).error("Unhandled exception occurred", exc_info=exc)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": {
@@ -460,40 +523,73 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
+def _select_event_loop(config) -> str:
+    """Select the uvicorn event loop implementation"""
+    if config.app_config.use_uvloop:
+        try:
+            import uvloop  # noqa: F401
+
+            return "uvloop"
+        except ImportError:
+            logger.warning("uvloop is not installed, using the default asyncio loop")
+    return "asyncio"
+
+
+def _select_http_protocol() -> str:
+    """Select the uvicorn HTTP protocol implementation"""
+    try:
+        import httptools  # noqa: F401
+
+        return "httptools"
+    except ImportError:
+        return "h11"
+
+
 def main():
     """Main entry point"""
-    # Setup logging with current environment variables
+    # Parse command line arguments for uvicorn
+    parser = argparse.ArgumentParser(prog="mvllm")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--reload", action="store_true")
+    parser.add_argument("--workers", type=int, default=1)
+    args, _ = parser.parse_known_args()
+
+    # 0 runs one worker per CPU core, up to MAX_AUTO_WORKERS. Every worker
+    # listens on the shared socket and owns its own HTTP client, load manager
+    # and health checks, so each one polls every server's /metrics
+    if args.workers > 0:
+        workers = args.workers
+    else:
+        workers = min(os.cpu_count() or 1, MAX_AUTO_WORKERS)
+    os.environ["WORKERS"] = str(workers)
+
+    # Setup logging with current environment variables (including WORKERS)
     setup_logging()
 
-    # Parse command line arguments for uvicorn
-    import sys
-
-    host = "0.0.0.0"
-    port = 8888
-    reload = False
-
-    # Parse sys.argv for uvicorn parameters
-    i = 0
-    while i < len(sys.argv):
-        if sys.argv[i] == "--host" and i + 1 < len(sys.argv):
-            host = sys.argv[i + 1]
-            i += 2
-        elif sys.argv[i] == "--port" and i + 1 < len(sys.argv):
-            port = int(sys.argv[i + 1])
-            i += 2
-        elif sys.argv[i] == "--reload":
-            reload = True
-            i += 1
-        else:
-            i += 1
+    logger.info(f"Starting server on {args.host}:{args.port} with {workers} worker(s)")
 
-    logger.info(f"Starting server on {host}:{port}")
+    # The load monitor, health checks and request forwarding all run on this
+    # loop, so the choice applies to the whole process
+    loop = _select_event_loop(get_config())
+    http = _select_http_protocol()
+    logger.info(f"Using {loop} event loop with {http} HTTP parser")
 
+    # Reload and multiple workers need an import string so that every
+    # process can load the application itself
     uvicorn.run(
-        app,
-        host=host,
-        port=port,
-        reload=reload,
+        "mvllm.main:app" if args.reload or workers > 1 else app,
+        host=args.host,
+        port=args.port,
+        reload=args.reload,
+        workers=workers,
+        loop=loop,
+        http=http,
+        backlog=8192,  # Absorb connection bursts without dropping SYNs
+        timeout_keep_alive=75,  # Keep idle client connections open for reuse
+        # Only applies when httptools is unavailable and h11 parses requests
+        h11_max_incomplete_event_size=16 * 1024 * 1024,
+        server_header=False,  # Upstream headers are relayed as-is
         log_config=None,  # Disable uvicorn's logging
         log_level="critical",  # Set to highest level to suppress log output
         access_log=False,  # Disable access logs
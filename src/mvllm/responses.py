@@ -0,0 +1,17 @@
+"""
+Response classes for vLLM Router
+"""
+
+import orjson
+from fastapi.responses import JSONResponse
+
+__all__ = [
+    "ORJSONResponse",
+]
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the standard library json module"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
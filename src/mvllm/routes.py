@@ -1,9 +1,11 @@
 import asyncio
 import httpx
+import msgspec
 import random
-from fastapi import APIRouter, Request, HTTPException, Depends
-from fastapi.responses import StreamingResponse, JSONResponse
-from typing import Union, List
+from fastapi import APIRouter, Request, Response, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from typing import Optional
 from loguru import logger
 from .config import Config, get_config
 from .load_manager import LoadManager, get_load_manager
@@ -15,7 +17,53 @@ __all__ = [
 router = APIRouter()
 
 
-async def _select_optimal_server(
+class _ModelOnly(msgspec.Struct):
+    """Request body view that decodes only the model field"""
+
+    model: Optional[str] = None
+
+
+_decode_model = msgspec.json.Decoder(_ModelOnly).decode
+
+# Hop-by-hop headers apply to a single connection and are not forwarded in
+# either direction (RFC 9110, section 7.6.1); Host is set by the client
+_HOP_BY_HOP = frozenset(
+    (
+        b"host",
+        b"connection",
+        b"keep-alive",
+        b"proxy-authenticate",
+        b"proxy-authorization",
+        b"te",
+        b"trailers",
+        b"transfer-encoding",
+        b"upgrade",
+    )
+)
+
+# Methods whose request body is forwarded upstream
+_BODY_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
+# Upstream client errors that are still worth retrying on another server;
+# any other 4xx is the client's fault and is relayed as-is
+_RETRYABLE_CLIENT_ERRORS = frozenset((408, 429))
+
+# Dedicated generator for server selection instead of the random module's
+# shared instance
+_rng = random.Random()
+
+
+async def _config_dependency() -> Config:
+    """Async wrapper around get_config, so FastAPI resolves it without a threadpool hop"""
+    return get_config()
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Get the shared, connection-pooled client created in the app lifespan"""
+    return request.app.state.http_client
+
+
+def _select_optimal_server(
     config: Config, load_manager: LoadManager, model: str = None
 ) -> str:
     """Select the healthy server with the lowest current load, optionally filtering servers that support the specified model"""
@@ -40,92 +88,40 @@ async def _select_optimal_server(
         else:
             raise HTTPException(status_code=503, detail="No healthy servers available")
 
-    # Get real-time load data
-    load_stats = load_manager.get_load_stats()
-
-    # Calculate a composite score for each server (load + available capacity)
-    candidates_under_threshold: List = []  # Store servers with score < 0.5
-    best_servers: List = []  # Store servers with the same score (fallback selection)
-    best_score = float("inf")
-
-    for server in healthy_servers:
-        server_load_info = load_stats["server_loads"].get(server.url, {})
-        detailed_metrics = server_load_info.get("detailed_metrics", {})
-        max_capacity = server_load_info.get("max_capacity", 3)
-
-        # Get detailed load data and capacity
-        running = detailed_metrics.get("num_requests_running", 0)
-        waiting = detailed_metrics.get("num_requests_waiting", 0)
-        capacity = max_capacity
-
-        # Calculate relative load (considering server capacity)
-        # Composite score: Running requests have higher weight, divide by capacity to ensure fair comparison
-        if capacity > 0:
-            score = (running + waiting * 0.5) / capacity
-        else:
-            score = float("inf")  # Servers with zero capacity should not be selected
-
-        # Collect servers with score < 0.5
-        if score < 0.5:
-            candidates_under_threshold.append(server)
-
-        # Also record servers with the best score as fallback
-        if score < best_score:
-            best_score = score
-            best_servers = [
-                server
-            ]  # Reset list to only include the current best server
-        elif score == best_score:
-            best_servers.append(server)  # Add servers with the same score
-
-    # Prioritize servers with score < 0.5
-    if candidates_under_threshold:
-        selected_server = random.choice(candidates_under_threshold)
-        selected_metrics = load_stats["server_loads"][selected_server.url][
-            "detailed_metrics"
-        ]
-        logger.info(
-            f"Selected server {selected_server.url} from {len(candidates_under_threshold)} candidates under threshold (score < 0.5) - Running: {selected_metrics['num_requests_running']}, Waiting: {selected_metrics['num_requests_waiting']}"
-        )
-        return selected_server.url
-
-    # If no servers with score < 0.5, select the one with the lowest score
-    if best_servers:
-        selected_server = random.choice(best_servers)
-        selected_metrics = load_stats["server_loads"][selected_server.url][
-            "detailed_metrics"
-        ]
-        logger.info(
-            f"Selected server {selected_server.url} from {len(best_servers)} candidates with best score {best_score} - Running: {selected_metrics['num_requests_running']}, Waiting: {selected_metrics['num_requests_waiting']}"
-        )
-        return selected_server.url
-
-    # Should theoretically never reach here
-    selected = healthy_servers[0]
-    logger.info(f"Randomly selected server {selected.url}")
-    return selected.url
+    # With a single healthy server there is nothing to rank
+    if len(healthy_servers) == 1:
+        return healthy_servers[0].url
+
+    # Prefer servers with score < 0.5, otherwise those with the lowest score
+    # Candidates are weighted by their headroom under the threshold
+    candidates, cum_weights = load_manager.get_optimal_candidates(healthy_servers)
+
+    selected = _rng.choices(candidates, cum_weights=cum_weights)[0]
+    logger.opt(lazy=True).debug(
+        "Selected server {} from {} candidates - "
+        "Score: {metrics[3]}, Running: {metrics[0]}, Waiting: {metrics[1]}",
+        lambda: selected,
+        lambda: len(candidates),
+        # The selected server's (running, waiting, capacity, score), looked up once
+        metrics=lambda: load_manager.get_server_score_view()[selected],
+    )
+    return selected
 
 
-async def _extract_model_from_request(request: Request) -> str:
-    """Extract model name from the request"""
+def _extract_model_from_request(request: Request, body: Optional[bytes]) -> str:
+    """Extract model name from the request, using the already-read request body"""
     try:
         # For chat completions and regular completions requests, the model is typically in the request body
         if request.method in ["POST"] and request.url.path in [
             "/v1/chat/completions",
             "/v1/completions",
         ]:
-            # Read the request body
-            body = await request.body()
             if not body:
                 return None
 
-            import json
-
             try:
-                request_data = json.loads(body)
-                model = request_data.get("model")
-                return model
-            except (json.JSONDecodeError, AttributeError):
+                return _decode_model(body).model
+            except msgspec.DecodeError:
                 pass
 
         # Get model from query parameters (if applicable)
@@ -136,98 +132,185 @@ async def _extract_model_from_request(request: Request) -> str:
         return None
 
 
+def _relay_headers(response: httpx.Response) -> list[tuple[bytes, bytes]]:
+    """Get upstream response headers as raw pairs for relaying to the client"""
+    # ASGI expects lowercase header names; repeated headers such as Set-Cookie are kept
+    relayed = []
+    for name, value in response.headers.raw:
+        name = name.lower()
+        # uvicorn adds its own Date header, so the upstream one would be a duplicate
+        if name not in _HOP_BY_HOP and name != b"date":
+            relayed.append((name, value))
+    return relayed
+
+
+def _record_server_failure(config: Config, server_url: str) -> None:
+    """Count a failed request against a server's health"""
+    config.update_server_health(server_url, False)
+
+
 async def _forward_request_with_retry(
     request: Request, path: str, method: str, config: Config, load_manager: LoadManager
-) -> Union[JSONResponse, StreamingResponse]:
+) -> StreamingResponse:
     """
     Forward request directly to the optimal server with retry logic
     """
-    # Get headers
-    headers = dict(request.headers)
-    headers.pop("host", None)  # Avoid header conflicts
+    # Get headers as raw (name, value) pairs, keeping repeated headers intact;
+    # ASGI servers already provide lowercase names
+    headers = [
+        (name, value)
+        for name, value in request.headers.raw
+        if name not in _HOP_BY_HOP
+    ]
+
+    # Read the request body once, only for methods that carry one; it is
+    # reused for model extraction and every retry
+    body = await request.body() if method in _BODY_METHODS else None
 
     # Extract model information
-    model = await _extract_model_from_request(request)
+    model = _extract_model_from_request(request, body)
+
+    # Every attempt goes through the shared client so upstream connections
+    # are kept alive and reused across requests
+    client = get_http_client(request)
+
+    # Bind the settings once per request; a config reload replaces app_config
+    # as a whole, so the request also sees one consistent set of values
+    app_config = config.app_config
+    max_retries = app_config.max_retries
+    request_timeout = app_config.request_timeout
 
     retries = 0
-    max_retries = config.app_config.max_retries
+    # A 504 is only returned when every attempt timed out
+    all_timeouts = True
 
     while retries <= max_retries:
         try:
             # Select the optimal server (filtered by model)
-            server_url = await _select_optimal_server(config, load_manager, model)
+            server_url = _select_optimal_server(config, load_manager, model)
             target_url = f"{server_url}{path}"
 
-            model_info = f" (model: {model})" if model else ""
-            logger.info(
-                f"Forwarding {method} {path} to {target_url}{model_info} (attempt {retries + 1}/{max_retries + 1})"
+            # Per-request logs on the success path are debug-level and formatted
+            # lazily, so they cost nothing at the default INFO level
+            logger.opt(lazy=True).debug(
+                "Forwarding {} {} to {}{} (attempt {}/{})",
+                lambda: method,
+                lambda: path,
+                lambda: target_url,
+                lambda: f" (model: {model})" if model else "",
+                lambda: retries + 1,
+                lambda: max_retries + 1,
             )
 
-            # Forward the request
-            async with httpx.AsyncClient(
-                timeout=config.app_config.request_timeout
-            ) as client:
-                # For requests that need a body, we need to re-read the request body
-                if method in ["POST", "PUT", "PATCH"]:
-                    body = await request.body()
-                    response = await client.request(
-                        method=method, url=target_url, content=body, headers=headers
-                    )
-                else:
-                    response = await client.request(
-                        method=method, url=target_url, headers=headers
-                    )
-
-            response.raise_for_status()  # Check response status
+            # Stream the response so the body is not buffered up front
+            upstream_request = client.build_request(
+                method,
+                target_url,
+                content=body,
+                headers=headers,
+                timeout=request_timeout,
+            )
 
-            # Handle successful response
-            if response.headers.get("content-type", "").startswith("text/event-stream"):
-                # Streaming response
-                async def stream_response():
+            # Count the request against the server until it completes, so
+            # concurrent selections account for it before the next metrics poll
+            load_manager.reserve(server_url)
+            try:
+                response = await client.send(upstream_request, stream=True)
+
+                # Retry on server errors, timeouts and rate limits; once the
+                # retries are used up the upstream error is relayed as-is
+                status_code = response.status_code
+                if retries < max_retries and (
+                    status_code >= 500 or status_code in _RETRYABLE_CLIENT_ERRORS
+                ):
                     try:
-                        async for chunk in response.aiter_bytes():
-                            yield chunk
-                    except Exception as e:
-                        logger.error(f"Error streaming response from {server_url}: {e}")
-                    finally:
-                        logger.info(
-                            f"Stream completed for {method} {path} from {server_url}"
-                        )
+                        response.raise_for_status()
+                    except httpx.HTTPStatusError:
+                        await response.aclose()
+                        raise
+            except BaseException:
+                load_manager.release(server_url)
+                raise
+
+            released = False
+
+            async def close_upstream():
+                """Release the upstream connection and the server reservation once"""
+                nonlocal released
+                await response.aclose()
+                if not released:
+                    released = True
+                    load_manager.release(server_url)
+
+            # Relay the body as raw bytes while it arrives, for event streams
+            # and regular responses alike, so nothing is buffered or re-encoded
+            async def relay_response():
+                try:
+                    async for chunk in response.aiter_raw():
+                        yield chunk
+                except Exception as e:
+                    logger.error(f"Error streaming response from {server_url}: {e}")
+                finally:
+                    await close_upstream()
+                    logger.opt(lazy=True).debug(
+                        "Request {} {} completed on {}{}",
+                        lambda: method,
+                        lambda: path,
+                        lambda: server_url,
+                        lambda: f" (model: {model})" if model else "",
+                    )
 
-                return StreamingResponse(
-                    stream_response(),
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                )
-            else:
-                # JSON response
-                logger.info(
-                    f"Request {method} {path} completed successfully on {server_url}{model_info}"
-                )
-                return JSONResponse(
-                    content=response.json(),
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                )
+            streaming_response = StreamingResponse(
+                relay_response(),
+                status_code=response.status_code,
+                # Also release the upstream connection if the client
+                # disconnects before the body is started
+                background=BackgroundTask(close_upstream),
+            )
+            streaming_response.raw_headers = _relay_headers(response)
+            return streaming_response
 
-        except (httpx.TimeoutException, httpx.ConnectError, httpx.HTTPStatusError) as e:
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            # TransportError covers timeouts, connection failures and broken
+            # connections (RemoteProtocolError, ReadError, WriteError)
             logger.warning(f"Request failed on {server_url}: {e}")
-
-            # Mark the server as unhealthy
-            config.update_server_health(server_url, False)
+            all_timeouts = all_timeouts and isinstance(e, httpx.TimeoutException)
+
+            # Only a server that could not be talked to is marked unhealthy; an
+            # error status means the server is up and may be fine for the next
+            # request. The bookkeeping runs as a loop callback, off this
+            # request's path, and is done before the backoff sleep ends and the
+            # next attempt starts
+            if not isinstance(e, httpx.HTTPStatusError):
+                asyncio.get_running_loop().call_soon(
+                    _record_server_failure, config, server_url
+                )
 
             if retries >= max_retries:
                 logger.error(
                     f"Request {method} {path} exceeded max retry count ({max_retries})"
                 )
+                if all_timeouts:
+                    raise HTTPException(
+                        status_code=504, detail="Gateway timeout - max retries exceeded"
+                    )
                 raise HTTPException(
                     status_code=502, detail="Bad gateway - max retries exceeded"
                 )
 
+            # Wait before retrying, backing off exponentially with jitter so
+            # retries against a flapping server are spread out
+            delay = min(
+                app_config.retry_max_delay,
+                app_config.retry_base_delay * (2**retries),
+            ) * (1 + _rng.random() * app_config.retry_jitter)
             retries += 1
             logger.info(f"Retrying request (attempt {retries}/{max_retries})")
-            # Wait before retrying
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(delay)
+
+        except HTTPException:
+            # Already classified, e.g. no healthy server supports the model
+            raise
 
         except Exception as e:
             logger.error(f"Unexpected error for request {method} {path}: {e}")
@@ -240,40 +323,35 @@ async def _forward_request_with_retry(
     )
 
 
-@router.post("/chat/completions")
-async def chat_completions(
-    request: Request,
-    config: Config = Depends(get_config),
-    load_manager: LoadManager = Depends(get_load_manager),
-):
+# Proxy endpoints return upstream responses directly: they skip FastAPI's
+# response model handling and resolve the config and load manager singletons
+# inside the handler instead of through Depends
+@router.post("/chat/completions", response_model=None)
+async def chat_completions(request: Request):
     """OpenAI-compatible chat completions endpoint"""
     return await _forward_request_with_retry(
         request=request,
         path="/v1/chat/completions",
         method="POST",
-        config=config,
-        load_manager=load_manager,
+        config=get_config(),
+        load_manager=get_load_manager(),
     )
 
 
-@router.post("/completions")
-async def completions(
-    request: Request,
-    config: Config = Depends(get_config),
-    load_manager: LoadManager = Depends(get_load_manager),
-):
+@router.post("/completions", response_model=None)
+async def completions(request: Request):
     """OpenAI-compatible completions endpoint"""
     return await _forward_request_with_retry(
         request=request,
         path="/v1/completions",
         method="POST",
-        config=config,
-        load_manager=load_manager,
+        config=get_config(),
+        load_manager=get_load_manager(),
     )
 
 
 @router.get("/models")
-async def models(config: Config = Depends(get_config)):
+async def models(config: Config = Depends(_config_dependency)):
     """OpenAI-compatible models endpoint - returns all available models from all servers"""
     try:
         # Update model information for all servers
@@ -325,29 +403,67 @@ async def models(config: Config = Depends(get_config)):
         )
 
 
-@router.post("/embeddings")
-async def embeddings(
-    request: Request,
-    config: Config = Depends(get_config),
-    load_manager: LoadManager = Depends(get_load_manager),
-):
+@router.post("/embeddings", response_model=None)
+async def embeddings(request: Request):
     """OpenAI-compatible embeddings endpoint"""
     return await _forward_request_with_retry(
         request=request,
         path="/v1/embeddings",
         method="POST",
-        config=config,
-        load_manager=load_manager,
+        config=get_config(),
+        load_manager=get_load_manager(),
     )
 
 
-@router.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
-async def openai_fallback(
-    path: str,
-    request: Request,
-    config: Config = Depends(get_config),
-    load_manager: LoadManager = Depends(get_load_manager),
-):
+# Other common OpenAI/vLLM endpoints get explicit routes with their upstream
+# path fixed at startup, so they do not go through the catch-all route
+_PROXIED_ROUTES = (
+    ("responses", ["POST"]),
+    ("rerank", ["POST"]),
+    ("score", ["POST"]),
+    ("audio/transcriptions", ["POST"]),
+    ("audio/translations", ["POST"]),
+    ("files", ["GET", "POST"]),
+    ("batches", ["GET", "POST"]),
+)
+
+
+def _make_proxy_endpoint(upstream_path: str):
+    """Create an endpoint that forwards requests to a fixed upstream path"""
+
+    async def proxy_endpoint(request: Request):
+        return await _forward_request_with_retry(
+            request=request,
+            path=upstream_path,
+            method=request.method,
+            config=get_config(),
+            load_manager=get_load_manager(),
+        )
+
+    return proxy_endpoint
+
+
+for _path, _methods in _PROXIED_ROUTES:
+    _endpoint = _make_proxy_endpoint(f"/v1/{_path}")
+    # One route per method keeps the OpenAPI operation IDs unique
+    for _method in _methods:
+        router.add_api_route(
+            f"/{_path}",
+            _endpoint,
+            methods=[_method],
+            name=f"proxy_{_path.replace('/', '_')}",
+            response_model=None,
+            response_class=Response,
+        )
+
+
+@router.api_route(
+    "/{path:path}",
+    methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+    response_model=None,
+    response_class=Response,
+)
+async def openai_fallback(path: str, request: Request):
     """Fallback route for any other OpenAI-compatible endpoints"""
     # Ensure the path starts with /v1/
     final_path = f"/v1/{path}" if not path.startswith("v1/") else f"/{path}"
@@ -356,6 +472,6 @@ async def openai_fallback(
         request=request,
         path=final_path,
         method=request.method,
-        config=config,
-        load_manager=load_manager,
+        config=get_config(),
+        load_manager=get_load_manager(),
     )
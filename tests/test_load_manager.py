@@ -0,0 +1,208 @@
+"""
+Tests for parsing vLLM /metrics responses in the load manager
+"""
+
+import asyncio
+
+import httpx
+
+from mvllm.config import Config, ServerConfig
+from mvllm.load_manager import LoadManager, _ALL_TARGETS
+
+METRICS_BODY = (
+    b"# HELP vllm:num_requests_running Number of requests in model execution batches.\n"
+    b"# TYPE vllm:num_requests_running gauge\n"
+    b'vllm:num_requests_running{engine="0",model_name="m1"} 3.0\n'
+    b'vllm:num_requests_waiting_by_reason{engine="0",reason="capacity"} 9.0\n'
+    b'vllm:num_requests_waiting{engine="0",model_name="m1"} 2.0\n'
+    b'vllm:gpu_cache_usage_perc{engine="0",model_name="m1"} 0.25\n'
+    b"process_max_fds 4096.0\n"
+    b'vllm:time_to_first_token_seconds_bucket{le="0.001"} 0.0\n'
+)
+
+
+class FakeStreamResponse:
+    """Response stand-in that yields a fixed sequence of body chunks"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+
+    async def aiter_bytes(self, chunk_size=None):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+def make_load_manager() -> LoadManager:
+    return LoadManager(Config(config_path="does-not-exist.toml"))
+
+
+def parse_stream(chunks) -> tuple[dict, FakeStreamResponse]:
+    response = FakeStreamResponse(chunks)
+    metrics = asyncio.run(make_load_manager()._parse_vllm_metrics_stream(response))
+    return metrics, response
+
+
+def assert_parsed(metrics: dict) -> None:
+    assert metrics["num_requests_running"] == 3
+    assert metrics["num_requests_waiting"] == 2
+    assert metrics["gpu_cache_usage_perc"] == 0.25
+    assert metrics["process_max_fds"] == 4096
+    assert metrics["system_load"] == 4  # 3 + 2, capped at 4096 // 1000
+
+
+def test_parse_stream_in_one_chunk():
+    metrics, _ = parse_stream([METRICS_BODY])
+    assert_parsed(metrics)
+
+
+def test_parse_stream_with_lines_split_across_chunks():
+    chunks = [METRICS_BODY[i : i + 7] for i in range(0, len(METRICS_BODY), 7)]
+    metrics, _ = parse_stream(chunks)
+    assert_parsed(metrics)
+
+
+def test_parse_stream_without_trailing_newline():
+    body = (
+        b"vllm:num_requests_running 3\n"
+        b"vllm:num_requests_waiting 2\n"
+        b"vllm:gpu_cache_usage_perc 0.25\n"
+        b"process_max_fds 4096"
+    )
+    metrics, _ = parse_stream([body[:40], body[40:]])
+    assert_parsed(metrics)
+
+
+def test_parse_stream_stops_parsing_but_drains_body():
+    # A later sample of an already found metric must not be parsed once all
+    # targets are found, but the body is still read to the end
+    chunks = [METRICS_BODY, b"vllm:num_requests_running 99\n", b"# EOF\n"]
+    metrics, response = parse_stream(chunks)
+    assert_parsed(metrics)
+    assert response.consumed == len(chunks)
+
+
+def test_parse_stream_with_missing_metrics_keeps_defaults():
+    metrics, _ = parse_stream([b"vllm:num_requests_running 5\n# EOF\n"])
+    assert metrics["num_requests_running"] == 5
+    assert metrics["num_requests_waiting"] == 0
+    assert metrics["process_max_fds"] == 65535
+
+
+def test_parse_metric_line_returns_target_bits():
+    load_manager = make_load_manager()
+    metrics = load_manager._default_metrics()
+    found = 0
+    for line in METRICS_BODY.split(b"\n"):
+        bit = load_manager._parse_metric_line(line, metrics)
+        assert bit & found == 0  # Every target is reported exactly once
+        found |= bit
+    assert found == _ALL_TARGETS
+
+
+def test_parse_metric_line_requires_name_boundary():
+    load_manager = make_load_manager()
+    metrics = load_manager._default_metrics()
+    line = b'vllm:num_requests_waiting_by_reason{reason="capacity"} 9.0'
+    assert load_manager._parse_metric_line(line, metrics) == 0
+    assert metrics["num_requests_waiting"] == 0
+
+    assert load_manager._parse_metric_line(b"vllm:num_requests_waiting 4", metrics)
+    assert metrics["num_requests_waiting"] == 4
+
+
+def test_parse_metric_line_ignores_invalid_value():
+    load_manager = make_load_manager()
+    metrics = load_manager._default_metrics()
+    assert load_manager._parse_metric_line(b"process_max_fds NaN-ish", metrics) == 0
+    assert metrics["process_max_fds"] == 65535
+
+
+def test_get_server_load_parses_streamed_metrics():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/metrics"
+        return httpx.Response(200, content=METRICS_BODY)
+
+    async def poll():
+        load_manager = make_load_manager()
+        load_manager._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await load_manager.get_server_load("http://server:8000")
+        finally:
+            await load_manager._client.aclose()
+
+    assert_parsed(asyncio.run(poll()))
+
+
+def test_get_server_load_returns_none_on_error_status():
+    async def poll():
+        load_manager = make_load_manager()
+        load_manager._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+        try:
+            return await load_manager.get_server_load("http://server:8000")
+        finally:
+            await load_manager._client.aclose()
+
+    assert asyncio.run(poll()) is None
+
+
+def test_rebuilt_panel_leaves_displayed_table_untouched():
+    # Live renders the panel from its refresh thread, so a rebuilt frame must
+    # not clear the table that may still be on screen
+    load_manager = make_load_manager()
+    load_manager.config.servers = [ServerConfig(url="http://server:8000")]
+    panel = load_manager.create_load_status_panel()
+    displayed = panel.renderable
+    assert displayed.row_count == 1
+
+    assert load_manager.create_load_status_panel() is panel
+    assert panel.renderable is not displayed
+    assert displayed.row_count == 1
+
+
+def test_reservations_are_not_counted_twice_after_a_poll():
+    # The mock server reports every request reserved so far as running, like
+    # vLLM does once the forwarded requests arrive
+    load_manager = make_load_manager()
+    server_url = "http://server:8000"
+    load_manager.config.servers = [
+        ServerConfig(url=server_url, max_concurrent_requests=4, is_healthy=True)
+    ]
+    load_manager._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(
+                200,
+                content=b"vllm:num_requests_running %d\n"
+                % load_manager._pending.get(server_url, 0),
+            )
+        )
+    )
+
+    def score() -> float:
+        return load_manager.get_server_score_view()[server_url][3]
+
+    async def run():
+        try:
+            load_manager.reserve(server_url)
+            load_manager.reserve(server_url)
+            assert score() == 0.5  # Not polled yet: 2 reserved of 4
+
+            await load_manager.update_all_server_loads()
+            assert score() == 0.5  # Polled: 2 running, none unseen
+
+            load_manager.reserve(server_url)
+            assert score() == 0.75  # 2 running + 1 unseen
+
+            for _ in range(3):
+                load_manager.release(server_url)
+            assert score() == 0.5  # The metrics still report 2 running
+
+            await load_manager.update_all_server_loads()
+            assert score() == 0.0
+        finally:
+            await load_manager._client.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,235 @@
+"""
+Tests for request forwarding, retries and server selection
+"""
+
+import collections
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from mvllm import load_manager as load_manager_module
+from mvllm import routes
+from mvllm.config import get_config, reset_config
+from mvllm.load_manager import get_load_manager
+from mvllm.main import app
+
+SERVERS_TOML = """
+[config]
+enable_active_health_check = false
+max_retries = 2
+retry_base_delay = 0
+failure_threshold = 100
+
+[servers]
+servers = [
+    {{ url = "http://server-a:8000", max_concurrent_requests = {a} }},
+    {{ url = "http://server-b:8000", max_concurrent_requests = {b} }},
+    {{ url = "http://server-c:8000", max_concurrent_requests = {c} }},
+]
+"""
+
+CHAT_BODY = {"model": "m1", "messages": [{"role": "user", "content": "hi"}]}
+
+
+def upstream_response(status_code, content=b"", headers=None) -> httpx.Response:
+    """Response with an unread body stream, as a real transport returns it"""
+    stream = httpx.ByteStream(content)
+    return httpx.Response(status_code, headers=headers, stream=stream)
+
+
+@pytest.fixture
+def make_config(tmp_path, monkeypatch):
+    """Load a fresh config and load manager for servers with the given capacities"""
+
+    def make(a=4, b=4, c=4):
+        config_path = tmp_path / "servers.toml"
+        config_path.write_text(SERVERS_TOML.format(a=a, b=b, c=c))
+        monkeypatch.setenv("CONFIG_PATH", str(config_path))
+        reset_config()
+        monkeypatch.setattr(load_manager_module, "_global_load_manager", None)
+
+        config = get_config()
+        for server in config.servers:
+            server.supported_models = ["m1"]
+        config._rebuild_model_index()
+        return config
+
+    yield make
+    reset_config()
+
+
+@pytest.fixture
+def upstream(make_config):
+    """Route the shared HTTP client to a handler and record every upstream call"""
+    make_config()
+    calls = []
+
+    def install(handler):
+        def record(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return handler(request)
+
+        app.state.http_client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        # The lifespan is not run, so no background tasks touch the servers
+        return TestClient(app, raise_server_exceptions=False)
+
+    yield install, calls
+    del app.state.http_client
+
+
+def test_success_is_relayed(upstream):
+    install, calls = upstream
+    client = install(
+        lambda request: upstream_response(200, b'{"id": "x"}', {"x-up": "1"})
+    )
+
+    response = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert response.status_code == 200
+    assert response.json() == {"id": "x"}
+    assert response.headers["x-up"] == "1"
+    assert len(calls) == 1
+    assert calls[0].url.path == "/v1/chat/completions"
+    assert b'"model":"m1"' in calls[0].content.replace(b" ", b"")
+
+
+def test_client_error_is_relayed_without_retry(upstream):
+    install, calls = upstream
+    client = install(lambda request: upstream_response(400, b'{"error": "bad"}'))
+
+    response = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert response.status_code == 400
+    assert response.json() == {"error": "bad"}
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("status_code", [500, 503, 429])
+def test_retryable_status_is_retried_then_relayed(upstream, status_code):
+    install, calls = upstream
+    client = install(lambda request: upstream_response(status_code, b"busy"))
+
+    response = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    # max_retries = 2, so three attempts; the last error is relayed as-is
+    assert response.status_code == status_code
+    assert response.text == "busy"
+    assert len(calls) == 3
+
+
+def test_server_error_then_success(upstream):
+    install, calls = upstream
+    statuses = iter([502, 200])
+    client = install(lambda request: upstream_response(next(statuses), b"ok"))
+
+    response = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert response.status_code == 200
+    assert response.text == "ok"
+    assert len(calls) == 2
+
+
+def raise_error(error_type):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise error_type("failed", request=request)
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    "error_type", [httpx.ConnectError, httpx.RemoteProtocolError, httpx.ReadError]
+)
+def test_transport_error_returns_bad_gateway(upstream, error_type):
+    install, calls = upstream
+    client = install(raise_error(error_type))
+
+    response = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert response.status_code == 502
+    assert len(calls) == 3
+
+
+def test_timeout_returns_gateway_timeout(upstream):
+    install, calls = upstream
+    client = install(raise_error(httpx.ReadTimeout))
+
+    response = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert response.status_code == 504
+    assert len(calls) == 3
+
+
+def test_mixed_timeouts_and_connect_errors_return_bad_gateway(upstream):
+    install, calls = upstream
+    errors = iter([httpx.ReadTimeout, httpx.ReadTimeout, httpx.ConnectError])
+    client = install(lambda request: raise_error(next(errors))(request))
+
+    response = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert response.status_code == 502
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    "handler",
+    [
+        lambda request: upstream_response(200, b"ok"),
+        lambda request: upstream_response(400),
+        lambda request: upstream_response(500),
+        raise_error(httpx.ConnectError),
+    ],
+    ids=["success", "client-error", "server-error", "connect-error"],
+)
+def test_reservations_are_released(upstream, handler):
+    install, calls = upstream
+    client = install(handler)
+
+    client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert calls
+    assert get_load_manager()._pending == {}
+
+
+def test_no_healthy_server_returns_service_unavailable(upstream):
+    install, calls = upstream
+    client = install(lambda request: upstream_response(200))
+    for server in get_config().servers:
+        server.is_healthy = False
+
+    response = client.post("/v1/chat/completions", json=CHAT_BODY)
+
+    assert response.status_code == 503
+    assert calls == []
+
+
+def test_selection_spread_honours_reservations(make_config):
+    config = make_config(a=10, b=3, c=4)
+    load_manager = get_load_manager()
+
+    # Reserving every pick fills the servers in proportion to their capacity
+    # before any metrics poll reports the requests
+    picks = collections.Counter()
+    for _ in range(17):
+        server_url = routes._select_optimal_server(config, load_manager, "m1")
+        load_manager.reserve(server_url)
+        picks[server_url] += 1
+
+    assert picks == {
+        "http://server-a:8000": 10,
+        "http://server-b:8000": 3,
+        "http://server-c:8000": 4,
+    }
+
+
+def test_selection_skips_server_marked_unhealthy(make_config):
+    config = make_config()
+    load_manager = get_load_manager()
+
+    config.app_config.failure_threshold = 1
+    config.update_server_health("http://server-b:8000", False)
+
+    picks = {
+        routes._select_optimal_server(config, load_manager, "m1") for _ in range(50)
+    }
+    assert "http://server-b:8000" not in picks